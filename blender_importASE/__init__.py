@@ -17,19 +17,12 @@ bl_info = {
 }
 
 import bpy
+# ImportHelper has to be imported at module level, the operator below inherits from it.
+# Everything pulling in ase/pyopenvdb is imported in execute() to keep enabling the addon cheap.
 from bpy_extras.io_utils import ImportHelper
-from ase import io
-import ase
-from ase.data import covalent_radii, colors
-from ase.build import make_supercell
 import numpy as np
-from ase import Atoms
+import sys
 from os.path import join
-import os
-from .import_cubefiles import cube2vol
-from .utils import setup_materials, group_atoms
-from .drawobjects import draw_atoms, draw_bonds, draw_unit_cell
-from .ui import import_ase_molecule
 
 
 class ImportASEMolecule(bpy.types.Operator, ImportHelper):
@@ -120,6 +113,10 @@ class ImportASEMolecule(bpy.types.Operator, ImportHelper):
         subtype='DIR_PATH'
     )
 
+    # drawn below the supercell box, in this order
+    _DRAW_PROPS = ("scale", "colorbonds", "fix_bonds", "representation", "color", "unit_cell",
+                   "separate_collections", "read_density", "zero_cell", "animate", "imageslice")
+
     def draw(self, context):
         layout = self.layout
         box = layout.box()
@@ -131,36 +128,47 @@ class ImportASEMolecule(bpy.types.Operator, ImportHelper):
             row = box.row(align=True)
             for j in range(3):
                 row.prop(self, "supercell1", index=i * 3 + j, emboss=False, slider=True)
-        layout.prop(self, "scale")
-        layout.prop(self, 'colorbonds')
-        layout.prop(self, 'fix_bonds')
-        layout.prop(self, 'representation')
-        layout.prop(self, 'color')
-        layout.prop(self, 'unit_cell')
-        layout.prop(self, 'separate_collections')
-        layout.prop(self, 'read_density')
-        layout.prop(self, 'zero_cell')
-        layout.prop(self, 'animate')
-        layout.prop(self,'imageslice')
+        for name in self._DRAW_PROPS:
+            layout.prop(self, name)
 
     def execute(self, context):
-        for file in self.files:
-            filepath = join(self.directory, file.name)
-            matrix = np.array(self.supercell1).reshape((3, 3))
-            default = [1, 0, 0, 0, 1, 0, 0, 0, 1]
-            SUPERCELL = False
-            for n, i in enumerate(self.supercell1):
-                if i != default[n]:
-                    SUPERCELL = True
-                break
-            import_ase_molecule(filepath, file.name, matrix,
-                                color=self.color, colorbonds=self.colorbonds, fix_bonds=self.fix_bonds, scale=self.scale,
-                                unit_cell=self.unit_cell, representation=self.representation,
-                                separate_collections=self.separate_collections,
-                                read_density=self.read_density, SUPERCELL=SUPERCELL, 
-                                shift_cell=self.zero_cell,imageslice=self.imageslice,
-                                animate=self.animate
-                                )
+        try:
+            from .ui import import_ase_molecules_batch
+        except ImportError as err:
+            if err.name == 'ase':
+                # prefer prebuilt wheels where they exist, pip still falls back to building from source
+                self.report({'ERROR'}, "ASE Importer needs ase, install it with: "
+                                       f"{sys.executable} -m pip install --prefer-binary ase")
+            else:
+                self.report({'ERROR'}, f"ASE Importer is missing a dependency ({err.name})")
+            return {'CANCELLED'}
+        # read every operator property once, each access on self goes through RNA
+        filenames = [file.name for file in self.files]
+        directory = self.directory
+        filepaths = [join(directory, name) for name in filenames]
+        supercell = list(self.supercell1)
+        matrix = np.array(supercell).reshape((3, 3))
+        default = [1, 0, 0, 0, 1, 0, 0, 0, 1]
+        SUPERCELL = False
+        for n, i in enumerate(supercell):
+            if i != default[n]:
+                SUPERCELL = True
+            break
+        opts = {
+            'color': self.color,
+            'colorbonds': self.colorbonds,
+            'fix_bonds': self.fix_bonds,
+            'scale': self.scale,
+            'unit_cell': self.unit_cell,
+            'representation': self.representation,
+            'separate_collections': self.separate_collections,
+            'read_density': self.read_density,
+            'SUPERCELL': SUPERCELL,
+            'shift_cell': self.zero_cell,
+            'imageslice': self.imageslice,
+            'animate': self.animate,
+        }
+        import_ase_molecules_batch(filepaths, filenames, matrix, **opts)
         return {"FINISHED"}
 
     def invoke(self, context, event):
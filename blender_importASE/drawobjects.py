@@ -10,6 +10,13 @@ from os.path import join
 import os
 import ase.neighborlist
 
+# sphere radius for each representation, looked up once per draw_atoms call
+_ATOM_RADIUS = {
+    "Balls'n'Sticks": lambda number, scale: covalent_radii[number] * 0.5 * scale,
+    'Licorice': lambda number, scale: 0.1,
+    'VDW': lambda number, scale: covalent_radii[number] * scale,
+}
+
 
 def draw_atoms(atoms, scale=1, representation="Balls'n'Sticks"):
     cnt = 0
@@ -22,20 +29,15 @@ def draw_atoms(atoms, scale=1, representation="Balls'n'Sticks"):
         bpy.ops.object.shade_smooth()
     sphere = bpy.context.object
     sphere.name = 'ref_sphere'
+    atom_radius = _ATOM_RADIUS.get(representation, _ATOM_RADIUS['VDW'])
     for n, atom in enumerate(atoms):
         ob = sphere.copy()
         ob.data = sphere.data.copy()
         ob.location = atom.position
         bpy.context.view_layer.active_layer_collection.collection.objects.link(ob)
         bpy.context.view_layer.active_layer_collection.collection.objects[-1].name = atom.symbol
-        if representation == "Balls'n'Sticks":
-            bpy.context.view_layer.active_layer_collection.collection.objects[-1].scale = [covalent_radii[
-                                                                                               atom.number] * 0.5 * scale, ] * 3
-        elif representation == 'Licorice':
-            bpy.context.view_layer.active_layer_collection.collection.objects[-1].scale = [0.1] * 3
-        else:
-            bpy.context.view_layer.active_layer_collection.collection.objects[-1].scale = [covalent_radii[
-                                                                                               atom.number] * scale, ] * 3
+        bpy.context.view_layer.active_layer_collection.collection.objects[-1].scale = [atom_radius(atom.number,
+                                                                                                  scale), ] * 3
         # sprint(bpy.data.node_groups)
         bpy.context.view_layer.active_layer_collection.collection.objects[-1].data.materials.append(
             bpy.data.materials[atom.symbol])
@@ -11,11 +11,9 @@ import os
 import ase.neighborlist
 
 
-def move_atoms(trajectory,list_of_atoms,imageslice):
+def move_atoms(trajectory,list_of_atoms):
 #    view_layer=bpy.context.view_layer
-    trajectory=trajectory[::imageslice]
     for ni,image in enumerate(trajectory):
-        #print(ni*imageslice)
         for n, atom_ob in enumerate(list_of_atoms):
             #print(ni,atom_ob)
             bpy.ops.object.select_all(action='DESELECT')
@@ -30,11 +28,9 @@ def move_atoms(trajectory,list_of_atoms,imageslice):
             atom_ob.keyframe_insert(data_path='location')
             atom_ob.select_set(False)
     return None
-def move_bonds(trajectory,list_of_bonds,NEIGHBORLIST,imageslice):
-    trajectory=trajectory[::imageslice]
+def move_bonds(trajectory,list_of_bonds,NEIGHBORLIST):
     for ni,image in enumerate(trajectory):
         cnt=0
-        #print(ni*imageslice)
         for na,atom in enumerate(image):
             neighbors, offsets = NEIGHBORLIST.get_neighbors(atom.index)
             for neighbor, offset in zip(neighbors, offsets):
@@ -61,12 +57,10 @@ def move_bonds(trajectory,list_of_bonds,NEIGHBORLIST,imageslice):
                         break
     #print(f'plotted {cnt*len(trajectory)} bonds')
     return None
-def move_longbonds(trajectory,list_of_bonds,NEIGHBORLIST,bondlengths,imageslice):
+def move_longbonds(trajectory,list_of_bonds,NEIGHBORLIST,bondlengths):
     #print("Using Longbond mech")
-    trajectory = trajectory[::imageslice]
     for ni,image in enumerate(trajectory):
         cnt=0
-        #print(ni*imageslice,cnt)
         #print(cnt,len(list_of_bonds))
         for na,atom in enumerate(image):
             neighbors, offsets = NEIGHBORLIST.get_neighbors(atom.index)
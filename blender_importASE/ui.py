@@ -6,30 +6,65 @@ from ase.data import covalent_radii, colors
 from ase.build import make_supercell
 import numpy as np
 from ase import Atoms
+from ase.io.formats import filetype, ioformats
 from os.path import join
 import os
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from .import_cubefiles import cube2vol
 from .utils import setup_materials, group_atoms
 from .drawobjects import draw_atoms, draw_bonds, draw_unit_cell, draw_bonds_new
 from .trajectory import move_atoms, move_bonds,move_longbonds
 
 
+# parsed files keyed by (path, mtime, size), so re-importing an unchanged file skips ASE
+_ATOMS_CACHE = OrderedDict()
+_ATOMS_CACHE_SIZE = 8
+_ATOMS_CACHE_LOCK = Lock()  # files of a batch are parsed from worker threads
+
+
+def _cached_read(filepath, index=':', format=None):
+    filepath = os.path.abspath(filepath)
+    stat = os.stat(filepath)
+    key = (filepath, index, stat.st_mtime_ns, stat.st_size)
+    with _ATOMS_CACHE_LOCK:
+        images = _ATOMS_CACHE.get(key)
+        if images is not None:
+            _ATOMS_CACHE.move_to_end(key)
+    if images is None:
+        images = ase.io.read(filepath, index=index, format=format)
+        with _ATOMS_CACHE_LOCK:
+            _ATOMS_CACHE[key] = images
+            if len(_ATOMS_CACHE) > _ATOMS_CACHE_SIZE:
+                _ATOMS_CACHE.popitem(last=False)
+    # hand out copies, the importer shifts positions in place
+    if isinstance(images, Atoms):
+        return images.copy()
+    return [image.copy() for image in images]
+
+
+def _read_images(filepath, imageslice=1, animate=True):
+    # let ASE skip the frames that are not animated instead of parsing and discarding them
+    fmt = filetype(filepath)
+    if not animate or ioformats[fmt].single:
+        # single-image formats (cube, POSCAR, ...) only accept index 0 or -1
+        return _cached_read(filepath, index=-1, format=fmt), []
+    images = _cached_read(filepath, index=f'::{imageslice}', format=fmt)
+    return images[0], images[1:]
+
+
 def import_ase_molecule(filepath, filename, matrix, colorbonds=False, fix_bonds=False, color=0.2, scale=1,
                         unit_cell=False,
                         representation="Balls'n'Sticks", separate_collections=False,
                         read_density=True, SUPERCELL=True, shift_cell=False, 
-                        imageslice=1, animate = True, **kwargs):
+                        imageslice=1, animate = True, known_symbols=None, images=None, **kwargs):
     
-    atoms = ase.io.read(filepath,index = ':')
-    if isinstance(atoms[0],Atoms) and len(atoms) > 1:
-        trajectory = True
-        TRAJECTORY=atoms.copy()[1:]
-        atoms=atoms[0]
-        if animate == False:
-            atoms = TRAJECTORY[-1]
-    elif len(atoms) == 1:
-        trajectory = False
-        atoms=atoms[0]
+    if images is None:
+        images = _read_images(filepath, imageslice=imageslice, animate=animate)
+    atoms, TRAJECTORY = images
+    trajectory = len(TRAJECTORY) > 0
     # When importing molecules from AMS, the resulting atoms do not lie in the unit cell since AMS uses unit cells centered around 0
     cell = atoms.cell
     shift_vector = 0.5 * cell[0] + 0.5 * cell[1] + 0.5 * cell[2]
@@ -37,7 +72,14 @@ def import_ase_molecule(filepath, filename, matrix, colorbonds=False, fix_bonds=
         atoms.positions += shift_vector
     #    if SUPERCELL == True:
     #        atoms=make_supercell(atoms,matrix)
-    setup_materials(atoms, colorbonds=colorbonds, color=color)
+    if known_symbols is None:
+        setup_materials(atoms, colorbonds=colorbonds, color=color)
+    else:
+        # only set up materials for elements not created by a previous file of the batch
+        new = [symbol not in known_symbols for symbol in atoms.get_chemical_symbols()]
+        if any(new):
+            setup_materials(atoms[new], colorbonds=colorbonds, color=color)
+            known_symbols.update(atoms.get_chemical_symbols())
     if separate_collections:
         my_coll = bpy.data.collections.new(name=atoms.get_chemical_formula() + '_' + filename.split('.')[0] + '_atoms')
     else:
@@ -81,11 +123,27 @@ def import_ase_molecule(filepath, filename, matrix, colorbonds=False, fix_bonds=
             # bpy.data.objects[name].location.z += shift_vector[2]
     if trajectory == True and animate == True:
 
-        move_atoms(TRAJECTORY,list_of_atoms,imageslice)
+        move_atoms(TRAJECTORY,list_of_atoms)
         if representation != 'VDW':
             if fix_bonds == True:
-                move_longbonds(TRAJECTORY,list_of_bonds,nl,bondlengths,imageslice)
+                move_longbonds(TRAJECTORY,list_of_bonds,nl,bondlengths)
             else:
-                move_bonds(TRAJECTORY,list_of_bonds,nl,imageslice)
+                move_bonds(TRAJECTORY,list_of_bonds,nl)
+
 
-            
+def import_ase_molecules_batch(filepaths, filenames, matrix, imageslice=1, animate=True, **kwargs):
+    # import several files in one call, sharing the element materials between them.
+    # Parsing runs in worker threads, bpy is not thread safe so all objects are built here.
+    known_symbols = set()
+    workers = max(1, min(8, len(filepaths)))
+    queued = iter(filepaths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # only keep a few files parsed ahead of the main thread, trajectories can be large
+        pending = deque(executor.submit(_read_images, filepath, imageslice, animate)
+                        for filepath in islice(queued, workers))
+        for filepath, filename in zip(filepaths, filenames):
+            images = pending.popleft().result()
+            for next_filepath in islice(queued, 1):
+                pending.append(executor.submit(_read_images, next_filepath, imageslice, animate))
+            import_ase_molecule(filepath, filename, matrix, known_symbols=known_symbols,
+                                imageslice=imageslice, animate=animate, images=images, **kwargs)